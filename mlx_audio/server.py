@@ -1,17 +1,33 @@
 import argparse
+import asyncio
+import hashlib
 import importlib.util
 import logging
+import multiprocessing as mp
 import os
+import queue
+import secrets
+import subprocess
 import sys
-import uuid
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 import numpy as np
 import soundfile as sf
 import uvicorn
-from fastapi import FastAPI, Form
+from fastapi import Depends, FastAPI, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 
 # Configure logging
@@ -28,13 +44,37 @@ def setup_logging(verbose: bool = False):
 logger = setup_logging()  # Will be updated with verbose setting in main()
 
 from mlx_audio.tts.generate import main as generate_main
+from mlx_audio.tts.generate import write_segments
 
 # Import from mlx_audio package
 from mlx_audio.tts.utils import load_model
 
 from .tts.audio_player import AudioPlayer
 
-app = FastAPI()
+# Default model, loaded on server startup
+DEFAULT_MODEL = "mlx-community/Kokoro-82M-4bit"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each uvicorn worker imports this module on its own, so the model, audio
+    # player and static mounts are set up here, once per worker, before it
+    # starts serving requests
+    global _state
+
+    state = setup_server()
+    try:
+        yield
+    finally:
+        # Clear the state too, so a later startup builds a new one instead of
+        # reusing the stopped worker
+        state.tts_worker.stop()
+        state.tts_executor.shutdown()
+        state.playback_executor.shutdown(wait=False)
+        _state = None
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware to allow requests from the same origin
 app.add_middleware(
@@ -45,33 +85,72 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load the model once on server startup.
-# You can change the model path or pass arguments as needed.
-# For performance, load once globally:
-tts_model = None  # Will be loaded when the server starts
-audio_player = None  # Will be initialized when the server starts
-
 # Make sure the output folder for generated TTS files exists
 # Use an absolute path that's guaranteed to be writable
 OUTPUT_FOLDER = os.path.join(os.path.expanduser("~"), ".mlx_audio", "outputs")
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
-logger.debug(f"Using output folder: {OUTPUT_FOLDER}")
+logger.debug("Using output folder: %s", OUTPUT_FOLDER)
+
+# Directory with the web interface files, resolved by find_static_dir()
+STATIC_DIR = None
+
+
+@dataclass
+class _KeyLock:
+    """Lock for one cache key, with the number of requests holding or awaiting it."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+@dataclass
+class ServerState:
+    """Everything the endpoints share, built once by setup_server()."""
+
+    # The model is loaded once, in a separate worker process, so long
+    # generations never hold up the web process
+    tts_worker: "TTSWorker"
+    # The TTS worker handles one request at a time, so every call to it goes
+    # through this single-worker executor. File and HTTP work stays on the
+    # event loop.
+    tts_executor: ThreadPoolExecutor
+    audio_player: Optional[AudioPlayer]
+    output_folder: str
+    # Per cache key locks, so identical requests only generate once
+    tts_locks: Dict[str, _KeyLock] = field(default_factory=dict)
+    # Feeds /play files to the audio player in the background, one file at a
+    # time, so files queued by consecutive requests play in order
+    playback_executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mlx_audio_playback"
+        )
+    )
+
+
+_state: Optional[ServerState] = None  # Will be built when the server starts
+
+
+def get_state() -> ServerState:
+    """FastAPI dependency returning the state built by setup_server()."""
+    if _state is None:
+        raise RuntimeError("Server is not set up, call setup_server() first")
+    return _state
 
 
 @app.post("/tts")
-def tts_endpoint(
+async def tts_endpoint(
     text: str = Form(...),
     voice: str = Form("af_heart"),
     speed: float = Form(1.0),
-    model: str = Form("mlx-community/Kokoro-82M-4bit"),
+    model: str = Form(DEFAULT_MODEL),
+    state: ServerState = Depends(get_state),
 ):
     """
     POST an x-www-form-urlencoded form with 'text' (and optional 'voice', 'speed', and 'model').
-    We run TTS on the text, save the audio in a unique file,
-    and return JSON with the filename so the client can retrieve it.
+    We run TTS on the text, save the audio in a file named after a hash of the
+    inputs, and return JSON with the filename so the client can retrieve it.
+    Repeated requests return the existing file without running the model.
     """
-    global tts_model
-
     if not text.strip():
         return JSONResponse({"error": "Text is empty"}, status_code=400)
 
@@ -98,122 +177,365 @@ def tts_endpoint(
             status_code=400,
         )
 
-    # Store current model repo_id for comparison
-    current_model_repo_id = (
-        getattr(tts_model, "repo_id", None) if tts_model is not None else None
-    )
+    # Identical requests map to the same file, so retries are served from disk
+    cache_key = hashlib.blake2b(
+        f"{model}|{voice}|{speed_float}|{text}".encode(), digest_size=16
+    ).hexdigest()
+    filename = f"tts_{cache_key}.wav"
+    output_path = os.path.join(state.output_folder, filename)
+
+    # Concurrent misses on the same key wait for the first one to finish. The
+    # lock is dropped once no request holds or awaits it; lock.locked() can't
+    # tell, as it is False between a release and the next waiter waking up.
+    tts_locks = state.tts_locks
+    key_lock = tts_locks.get(cache_key)
+    if key_lock is None:
+        key_lock = tts_locks[cache_key] = _KeyLock()
+    key_lock.users += 1
+    try:
+        async with key_lock.lock:
+            if os.path.exists(output_path):
+                logger.debug("Serving cached audio file: %s", output_path)
+                return {"filename": filename, "cached": True}
 
-    # Load the model if it's not loaded or if a different model is requested
-    if tts_model is None or current_model_repo_id != model:
-        try:
-            logger.debug(f"Loading TTS model from {model}")
-            tts_model = load_model(model)
-            logger.debug("TTS model loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading TTS model: {str(e)}")
-            return JSONResponse(
-                {"error": f"Failed to load model: {str(e)}"}, status_code=500
+            return await _generate_tts_file(
+                state, text, voice, speed_float, model, output_path
             )
+    finally:
+        key_lock.users -= 1
+        if key_lock.users == 0:
+            del tts_locks[cache_key]
+
+
+async def _generate_tts_file(
+    state: ServerState,
+    text: str,
+    voice: str,
+    speed: float,
+    model: str,
+    output_path: str,
+):
+    """
+    Have the TTS worker write the generated speech to output_path, loading
+    the requested model first if needed. The file is written under a
+    temporary name and renamed once complete, so a cache hit never sees a
+    partial file.
+    """
+    loop = asyncio.get_running_loop()
 
-    # We'll do something like the code in model.generate() from the TTS library:
-    # Generate the unique filename
-    unique_id = str(uuid.uuid4())
-    filename = f"tts_{unique_id}.wav"
-    output_path = os.path.join(OUTPUT_FOLDER, filename)
+    # Output names are deterministic, so only the temporary file needs a random
+    # suffix to keep concurrent writers apart
+    temp_path = f"{output_path}.{secrets.token_urlsafe(12)}.part"
 
     logger.debug(
-        f"Generating TTS for text: '{text[:50]}...' with voice: {voice}, speed: {speed_float}, model: {model}"
+        "Generating TTS for text: '%s...' with voice: %s, speed: %s, model: %s",
+        text[:50],
+        voice,
+        speed,
+        model,
     )
-    logger.debug(f"Output file will be: {output_path}")
-
-    # We'll use the high-level "model.generate" method:
-    results = tts_model.generate(
-        text=text,
-        voice=voice,
-        speed=speed_float,
-        lang_code=voice[0],
-        verbose=False,
-    )
-
-    # We'll just gather all segments (if any) into a single wav
-    # It's typical for multi-segment text to produce multiple wave segments:
-    audio_arrays = []
-    for segment in results:
-        audio_arrays.append(segment.audio)
+    logger.debug("Output file will be: %s", output_path)
 
-    # If no segments, return error
-    if not audio_arrays:
-        logger.error("No audio segments generated")
-        return JSONResponse({"error": "No audio generated"}, status_code=500)
-
-    # Concatenate all segments
-    cat_audio = np.concatenate(audio_arrays, axis=0)
-
-    # Write the audio as a WAV
+    # The worker process streams each segment straight into the WAV file,
+    # so the full waveform is never held in memory
     try:
-        sf.write(output_path, cat_audio, 24000)
-        logger.debug(f"Successfully wrote audio file to {output_path}")
+        result = await loop.run_in_executor(
+            state.tts_executor,
+            lambda: state.tts_worker.generate(
+                model=model,
+                output_path=temp_path,
+                text=text,
+                voice=voice,
+                speed=speed,
+            ),
+        )
+        if "error" in result:
+            logger.error("Error generating audio: %s", result["error"])
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return JSONResponse({"error": result["error"]}, status_code=500)
 
-        # Verify the file exists
-        if not os.path.exists(output_path):
-            logger.error(f"File was not created at {output_path}")
-            return JSONResponse(
-                {"error": "Failed to create audio file"}, status_code=500
-            )
+        # soundfile raises if writing fails, so the file is known to be complete
+        # here. The frame count from the worker replaces a stat of the file.
+        num_frames = result["num_frames"]
+        logger.debug("Wrote %d frames to %s", num_frames, temp_path)
 
-        # Check file size
-        file_size = os.path.getsize(output_path)
-        logger.debug(f"File size: {file_size} bytes")
+        # If no audio was generated, return error
+        if num_frames == 0:
+            logger.error("No audio generated")
+            os.remove(temp_path)
+            return JSONResponse({"error": "No audio generated"}, status_code=500)
 
-        if file_size == 0:
-            logger.error("File was created but is empty")
-            return JSONResponse(
-                {"error": "Generated audio file is empty"}, status_code=500
-            )
+        os.replace(temp_path, output_path)
 
     except Exception as e:
-        logger.error(f"Error writing audio file: {str(e)}")
+        logger.error("Error writing audio file: %s", e)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
         return JSONResponse(
             {"error": f"Failed to save audio: {str(e)}"}, status_code=500
         )
 
-    return {"filename": filename}
+    return {"filename": os.path.basename(output_path), "cached": False}
 
 
-@app.get("/audio/{filename}")
-def get_audio_file(filename: str):
+class BufferPool:
     """
-    Return an audio file from the outputs folder.
-    The user can GET /audio/<filename> to fetch the WAV file.
+    Pool of reusable 1-D buffers of a single dtype, bucketed by size rounded up
+    to a power of two. Requests above max_size are allocated normally and never
+    pooled.
     """
-    file_path = os.path.join(OUTPUT_FOLDER, filename)
-    logger.debug(f"Requested audio file: {file_path}")
 
-    if not os.path.exists(file_path):
-        logger.error(f"File not found: {file_path}")
-        # List files in the directory to help debug
+    def __init__(
+        self, dtype=np.float32, max_size: int = 1 << 23, max_per_bucket: int = 2
+    ):
+        self.dtype = np.dtype(dtype)
+        self.max_size = max_size
+        self.max_per_bucket = max_per_bucket
+        self._buckets = {}
+
+    def _bucket(self, size: int) -> queue.LifoQueue:
+        bucket = self._buckets.get(size)
+        if bucket is None:
+            bucket = self._buckets.setdefault(
+                size, queue.LifoQueue(maxsize=self.max_per_bucket)
+            )
+        return bucket
+
+    def acquire(self, n: int) -> np.ndarray:
+        """Return an array of length n, reusing pooled storage if possible."""
+        size = 1 << max(n - 1, 0).bit_length()
+        if size > self.max_size:
+            return np.empty(n, dtype=self.dtype)
+        try:
+            base = self._bucket(size).get_nowait()
+        except queue.Empty:
+            base = np.empty(size, dtype=self.dtype)
+        return base[:n]
+
+    def release(self, buf: np.ndarray):
+        """Give a buffer (or any view of it) from acquire() back to the pool."""
+        base = buf if buf.base is None else buf.base
+        size = base.shape[0]
+        if base.ndim != 1 or base.dtype != self.dtype or size > self.max_size:
+            return
+        if size & (size - 1):
+            return  # Not a pooled size
+        try:
+            self._bucket(size).put_nowait(base)
+        except queue.Full:
+            pass
+
+
+# Up to 2**23 samples, about 5.8 minutes of 24 kHz mono audio
+pcm16_buffer_pool = BufferPool(np.int16)
+
+
+def _float_to_pcm16_numpy(audio, out):
+    """Quantize float32 samples in [-1, 1] to int16, clipping out of range values."""
+    np.copyto(
+        out,
+        np.clip(np.rint(audio * np.float32(32767.0)), -32768.0, 32767.0),
+        casting="unsafe",
+    )
+
+
+if numba is not None:
+
+    # Not parallel: segments are short, and a parallel kernel called from the
+    # worker's writer thread can keep the process from exiting under numba's
+    # TBB threading layer
+    @numba.njit(fastmath=True, cache=True)
+    def float_to_pcm16(audio, out):
+        """Quantize float32 samples in [-1, 1] to int16, clipping out of range values."""
+        # Scale in float32, like the NumPy version, so both round identically
+        scale = np.float32(32767.0)
+        for i in range(audio.shape[0]):
+            v = round(audio[i] * scale)
+            if v > 32767:
+                v = 32767
+            elif v < -32768:
+                v = -32768
+            out[i] = np.int16(v)
+
+else:
+    float_to_pcm16 = _float_to_pcm16_numpy
+
+
+def _tts_worker(model_path: str, requests, responses):
+    """
+    Entry point of the TTS worker process. Loads the model once, then handles
+    generation requests from the requests queue one at a time, replying on the
+    responses queue, until it receives None.
+    """
+    try:
+        model = load_model(model_path)
+    except Exception as e:
+        responses.put({"error": f"Failed to load model: {str(e)}"})
+        return
+    responses.put({"model": model_path})
+
+    while True:
+        job = requests.get()
+        if job is None:
+            break
+
+        # Load a different model only when one is requested. Reusing the loaded
+        # model also keeps its cached pipelines and voice packs.
+        if job["model"] != model_path:
+            try:
+                model = load_model(job["model"])
+                model_path = job["model"]
+            except Exception as e:
+                responses.put({"error": f"Failed to load model: {str(e)}"})
+                continue
+
         try:
-            files = os.listdir(OUTPUT_FOLDER)
-            logger.debug(f"Files in output directory: {files}")
+            num_frames = _write_segments(
+                model.generate(
+                    text=job["text"],
+                    voice=job["voice"],
+                    speed=job["speed"],
+                    lang_code=job["voice"][0],
+                    verbose=False,
+                ),
+                job["output_path"],
+            )
+            responses.put({"num_frames": num_frames})
         except Exception as e:
-            logger.error(f"Error listing output directory: {str(e)}")
+            responses.put({"error": f"Failed to save audio: {str(e)}"})
 
-        return JSONResponse({"error": "File not found"}, status_code=404)
 
-    logger.debug(f"Serving audio file: {file_path}")
-    return FileResponse(file_path, media_type="audio/wav")
+class TTSWorker:
+    """
+    Runs the TTS model in a separate process, so the web process never touches
+    MLX and stays responsive during long generations. Requests are handled one
+    at a time and generate() blocks until the worker replies, so it must only
+    be called from ServerState.tts_executor. If the process dies, the next
+    generate() starts a new one.
+    """
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self.process = None
+
+    def start(self):
+        """Start a worker process and wait for it to load the model."""
+        ctx = mp.get_context("spawn")
+        self.requests = ctx.Queue()
+        self.responses = ctx.Queue()
+        self.process = ctx.Process(
+            target=_tts_worker,
+            args=(self.model_path, self.requests, self.responses),
+            daemon=True,
+        )
+        self.process.start()
+        reply = self._wait()
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+
+    def generate(self, **job) -> dict:
+        """
+        Generate speech into job["output_path"]. Returns {"num_frames": n},
+        or {"error": message} if loading the model or generating failed.
+        """
+        # Replace a worker that died, e.g. out of memory during a long
+        # generation, loading the model this job asks for
+        if not self.process.is_alive():
+            logger.warning(
+                "TTS worker process exited with code %s, restarting it",
+                self.process.exitcode,
+            )
+            self.model_path = job["model"]
+            self.start()
+
+        self.requests.put(job)
+        return self._wait()
+
+    def _wait(self) -> dict:
+        while True:
+            try:
+                return self.responses.get(timeout=1.0)
+            except queue.Empty:
+                if not self.process.is_alive():
+                    raise RuntimeError("TTS worker process exited unexpectedly")
+
+    def stop(self):
+        """Ask the worker process to exit and wait for it, killing it if it hangs."""
+        if self.process is not None and self.process.is_alive():
+            self.requests.put(None)
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                logger.warning("TTS worker process did not exit, terminating it")
+                self.process.terminate()
+                self.process.join()
+
+
+def _write_pcm16(f: sf.SoundFile, audio: np.ndarray):
+    """
+    Quantize float32 samples to 16-bit PCM and append them to f, so libsndfile
+    only has to copy them.
+    """
+    pcm = pcm16_buffer_pool.acquire(audio.shape[0])
+    try:
+        float_to_pcm16(audio, pcm)
+        f.write(pcm)
+    finally:
+        pcm16_buffer_pool.release(pcm)
+
+
+def _write_segments(results, output_path: str) -> int:
+    """
+    Write each generated segment to a 24 kHz mono WAV file as it arrives, and
+    return the number of frames written.
+    """
+    with sf.SoundFile(
+        output_path,
+        "w",
+        samplerate=24000,
+        channels=1,
+        subtype="PCM_16",
+        format="WAV",
+    ) as f:
+        _, num_frames = write_segments(
+            results, lambda i, audio: _write_pcm16(f, audio), dtype=np.float32
+        )
+    return num_frames
+
+
+class AudioFiles(StaticFiles):
+    """
+    StaticFiles for the output folder that answers like the other endpoints:
+    a JSON error body for missing files, and generated files served as
+    audio/wav.
+    """
+
+    async def get_response(self, path: str, scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            if e.status_code != 404:
+                raise
+            logger.error("File not found: %s", path)
+            return JSONResponse({"error": "File not found"}, status_code=404)
+
+    def file_response(
+        self, full_path, stat_result, scope, status_code: int = 200
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if response.status_code != 304:
+            response.headers["content-type"] = "audio/wav"
+        return response
 
 
 @app.get("/")
-def root():
+async def root():
     """
     Serve the audio_player.html page or a fallback HTML if not found
     """
     try:
-        # Try to find the audio_player.html file in the package
-        static_dir = find_static_dir()
-        audio_player_path = os.path.join(static_dir, "audio_player.html")
-        return FileResponse(audio_player_path)
+        # The static directory is resolved once and cached by find_static_dir
+        return FileResponse(os.path.join(find_static_dir(), "audio_player.html"))
     except Exception as e:
         # If there's an error, return a simple HTML page with error information
         return HTMLResponse(
@@ -237,7 +559,16 @@ def root():
 
 
 def find_static_dir():
-    """Find the static directory containing HTML files."""
+    """Find the static directory containing HTML files, resolving it only once."""
+    global STATIC_DIR
+
+    if STATIC_DIR is None:
+        STATIC_DIR = _locate_static_dir()
+    return STATIC_DIR
+
+
+def _locate_static_dir():
+    """Probe the installed package for the static directory."""
     # Try different methods to find the static directory
 
     # Method 1: Use importlib.resources (Python 3.9+)
@@ -298,30 +629,27 @@ def find_static_dir():
 
 
 @app.post("/play")
-def play_audio(filename: str = Form(...)):
+async def play_audio(
+    filename: str = Form(...), state: ServerState = Depends(get_state)
+):
     """
     Play audio directly from the server using the AudioPlayer.
-    Expects a filename that exists in the OUTPUT_FOLDER.
+    Expects a filename that exists in the output folder.
     """
-    global audio_player
-
+    audio_player = state.audio_player
     if audio_player is None:
         return JSONResponse({"error": "Audio player not initialized"}, status_code=500)
 
-    file_path = os.path.join(OUTPUT_FOLDER, filename)
+    file_path = os.path.join(state.output_folder, filename)
     if not os.path.exists(file_path):
         return JSONResponse({"error": "File not found"}, status_code=404)
 
     try:
-        # Load the audio file
-        audio_data, sample_rate = sf.read(file_path)
-
-        # If audio is stereo, convert to mono
-        if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:
-            audio_data = audio_data.mean(axis=1)
-
-        # Queue the audio for playback
-        audio_player.queue_audio(audio_data)
+        # Open the file here, so unreadable files are reported to the client,
+        # then feed it to the player in the background
+        loop = asyncio.get_running_loop()
+        audio_file = await loop.run_in_executor(None, sf.SoundFile, file_path)
+        state.playback_executor.submit(_queue_audio_file, audio_file, audio_player)
 
         return {"status": "playing", "filename": filename}
     except Exception as e:
@@ -330,13 +658,62 @@ def play_audio(filename: str = Form(...)):
         )
 
 
+# How many blocks /play keeps queued on the player ahead of playback
+MAX_QUEUED_BLOCKS = 4
+
+
+def _queue_audio_file(f: sf.SoundFile, player: AudioPlayer):
+    """
+    Read an open audio file as float32 blocks and queue each block, converted
+    to mono, on the player, then close the file. Playback starts with the first
+    block, and reading waits while MAX_QUEUED_BLOCKS blocks are still queued,
+    so memory use does not grow with the length of the file. Stops early if
+    the player is stopped.
+    """
+    # A whole number of player callbacks per block, so no callback gets a
+    # partial block padded with silence
+    blocksize = player.buffer_size * 2
+    # Poll twice per block of playback while the player's queue is full
+    poll_interval = blocksize / player.sample_rate / 2
+    try:
+        with f:
+            buf = np.empty((blocksize, f.channels), dtype=np.float32)
+            for i, block in enumerate(f.blocks(out=buf)):
+                while len(player.audio_buffer) >= MAX_QUEUED_BLOCKS:
+                    time.sleep(poll_interval)
+                if i > 0 and not player.playing:
+                    logger.debug("Playback stopped, no longer reading %s", f.name)
+                    return
+                # queue_audio copies the samples, so the buffer can be reused
+                player.queue_audio(_downmix_to_mono(block))
+    except Exception as e:
+        # Nobody waits on this in the background, so log the failure
+        logger.error("Error playing audio file %s: %s", f.name, e)
+
+
+def _downmix_to_mono(audio_data: np.ndarray) -> np.ndarray:
+    """Average the channels of float32 audio without float64 temporaries."""
+    if audio_data.ndim == 1:
+        return audio_data
+
+    num_channels = audio_data.shape[1]
+    if num_channels == 1:
+        return audio_data[:, 0]
+    if num_channels == 2:
+        mono = np.empty(audio_data.shape[0], dtype=np.float32)
+        np.add(audio_data[:, 0], audio_data[:, 1], out=mono)
+    else:
+        mono = np.einsum("ij->i", audio_data)
+    mono *= 1.0 / num_channels
+    return mono
+
+
 @app.post("/stop")
-def stop_audio():
+def stop_audio(state: ServerState = Depends(get_state)):
     """
     Stop any currently playing audio.
     """
-    global audio_player
-
+    audio_player = state.audio_player
     if audio_player is None:
         return JSONResponse({"error": "Audio player not initialized"}, status_code=500)
 
@@ -350,99 +727,133 @@ def stop_audio():
 
 
 @app.post("/open_output_folder")
-def open_output_folder():
+async def open_output_folder(state: ServerState = Depends(get_state)):
     """
     Open the output folder in the system file explorer (Finder on macOS).
     This only works when running on localhost for security reasons.
     """
-    global OUTPUT_FOLDER
+    output_folder = state.output_folder
 
     # Check if the request is coming from localhost
     # Note: In a production environment, you would want to check the request IP
 
+    # Finder on macOS, Explorer on Windows and the default file manager on Linux
+    commands = {
+        "darwin": ["open", output_folder],
+        "win32": ["explorer", output_folder],
+        "linux": ["xdg-open", output_folder],
+    }
+
     try:
-        # For macOS (Finder)
-        if sys.platform == "darwin":
-            os.system(f"open {OUTPUT_FOLDER}")
-        # For Windows (Explorer)
-        elif sys.platform == "win32":
-            os.system(f"explorer {OUTPUT_FOLDER}")
-        # For Linux (various file managers)
-        elif sys.platform == "linux":
-            os.system(f"xdg-open {OUTPUT_FOLDER}")
-        else:
+        if sys.platform not in commands:
             return JSONResponse(
                 {"error": f"Unsupported platform: {sys.platform}"}, status_code=500
             )
 
-        logger.debug(f"Opened output folder: {OUTPUT_FOLDER}")
-        return {"status": "opened", "path": OUTPUT_FOLDER}
+        # Spawn the file explorer directly without a shell and don't wait for it
+        subprocess.Popen(
+            commands[sys.platform],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        logger.debug("Opened output folder: %s", output_folder)
+        return {"status": "opened", "path": output_folder}
     except Exception as e:
-        logger.error(f"Error opening output folder: {str(e)}")
+        logger.error("Error opening output folder: %s", e)
         return JSONResponse(
             {"error": f"Failed to open output folder: {str(e)}"}, status_code=500
         )
 
 
-def setup_server():
-    """Setup the server by loading the model and creating the output directory."""
-    global tts_model, audio_player, OUTPUT_FOLDER
+def setup_server() -> ServerState:
+    """
+    Setup the server by creating the output directory, starting the TTS worker
+    and audio player, and mounting the static directories. Returns the shared
+    ServerState; calling it again returns the existing one.
+    """
+    global _state
+
+    if _state is not None:
+        return _state
 
     # Make sure the output folder for generated TTS files exists
+    output_folder = OUTPUT_FOLDER
     try:
-        os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+        os.makedirs(output_folder, exist_ok=True)
         # Test write permissions by creating a test file
-        test_file = os.path.join(OUTPUT_FOLDER, "test_write.txt")
+        test_file = os.path.join(output_folder, "test_write.txt")
         with open(test_file, "w") as f:
             f.write("Test write permissions")
         os.remove(test_file)
-        logger.debug(f"Output directory {OUTPUT_FOLDER} is writable")
+        logger.debug("Output directory %s is writable", output_folder)
     except Exception as e:
-        logger.error(f"Error with output directory {OUTPUT_FOLDER}: {str(e)}")
+        logger.error("Error with output directory %s: %s", output_folder, e)
         # Try to use a fallback directory in /tmp
         fallback_dir = os.path.join("/tmp", "mlx_audio_outputs")
-        logger.debug(f"Trying fallback directory: {fallback_dir}")
+        logger.debug("Trying fallback directory: %s", fallback_dir)
         try:
             os.makedirs(fallback_dir, exist_ok=True)
-            OUTPUT_FOLDER = fallback_dir
-            logger.debug(f"Using fallback output directory: {OUTPUT_FOLDER}")
+            output_folder = fallback_dir
+            logger.debug("Using fallback output directory: %s", output_folder)
         except Exception as fallback_error:
-            logger.error(f"Error with fallback directory: {str(fallback_error)}")
-
-    # Load the model if not already loaded
-    if tts_model is None:
-        try:
-            default_model = (
-                "mlx-community/Kokoro-82M-4bit"  # Same default as in tts_endpoint
-            )
-            logger.debug(f"Loading TTS model from {default_model}")
-            tts_model = load_model(default_model)
-            logger.debug("TTS model loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading TTS model: {str(e)}")
-            raise
+            logger.error("Error with fallback directory: %s", fallback_error)
 
-    # Initialize the audio player if not already initialized
-    if audio_player is None:
-        try:
-            logger.debug("Initializing audio player")
-            audio_player = AudioPlayer()
-            logger.debug("Audio player initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing audio player: {str(e)}")
+    # Start the TTS worker process and load the model
+    try:
+        logger.debug("Starting TTS worker with model %s", DEFAULT_MODEL)
+        tts_worker = TTSWorker(DEFAULT_MODEL)
+        tts_worker.start()
+        logger.debug("TTS model loaded successfully")
+    except Exception as e:
+        logger.error("Error loading TTS model: %s", e)
+        raise
 
-    # Try to mount the static files directory
+    # Initialize the audio player
+    audio_player = None
     try:
-        static_dir = find_static_dir()
-        logger.debug(f"Found static directory: {static_dir}")
-        app.mount("/static", StaticFiles(directory=static_dir), name="static")
-        logger.debug("Static files mounted successfully")
+        logger.debug("Initializing audio player")
+        audio_player = AudioPlayer()
+        logger.debug("Audio player initialized successfully")
     except Exception as e:
-        logger.error(f"Could not mount static files directory: {e}")
-        logger.warning(
-            "The server will still function, but the web interface may be limited."
+        logger.error("Error initializing audio player: %s", e)
+
+    _state = ServerState(
+        tts_worker=tts_worker,
+        tts_executor=ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mlx_audio_tts"
+        ),
+        audio_player=audio_player,
+        output_folder=output_folder,
+    )
+
+    mounted = {getattr(route, "name", None) for route in app.routes}
+
+    # Serve generated audio at /audio/<filename> straight from the output folder.
+    # StaticFiles handles conditional and range requests, so browsers can seek.
+    if "audio" not in mounted:
+        app.mount(
+            "/audio",
+            AudioFiles(directory=output_folder, check_dir=False),
+            name="audio",
         )
 
+    # Try to mount the static files directory
+    if "static" not in mounted:
+        try:
+            static_dir = find_static_dir()
+            logger.debug("Found static directory: %s", static_dir)
+            app.mount("/static", StaticFiles(directory=static_dir), name="static")
+            logger.debug("Static files mounted successfully")
+        except Exception as e:
+            logger.error("Could not mount static files directory: %s", e)
+            logger.warning(
+                "The server will still function, but the web interface may be limited."
+            )
+
+    return _state
+
 
 def main(host="127.0.0.1", port=8000, verbose=False):
     """Parse command line arguments for the server and start it."""
@@ -459,6 +870,20 @@ def main(host="127.0.0.1", port=8000, verbose=False):
         default=8000,
         help="Port to bind the server to (default: 8000)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes, each loading its own model and audio "
+            "player (default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Log every HTTP request (disabled by default)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -470,12 +895,33 @@ def main(host="127.0.0.1", port=8000, verbose=False):
     global logger
     logger = setup_logging(args.verbose)
 
-    # Start the server with the parsed arguments
-    setup_server()
+    # Use the libuv event loop and the C HTTP parser when they are installed
+    # (pip install mlx-audio[server]) instead of relying on auto-detection
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.debug("Using event loop: %s, HTTP parser: %s", loop, http)
+
+    if args.workers > 1:
+        # Workers share nothing: every one of them starts its own TTS process
+        # and audio player, and requests land on whichever worker accepts them
+        logger.warning(
+            "Running %d workers: each loads its own copy of the model, and "
+            "/play and /stop may reach different workers, so server-side "
+            "playback is unreliable",
+            args.workers,
+        )
+
+    # Start the server with the parsed arguments. The model is loaded by the
+    # app's lifespan handler; multiple workers need an import string so that
+    # every worker process can import the app itself.
     uvicorn.run(
-        app,
+        "mlx_audio.server:app" if args.workers > 1 else app,
         host=args.host,
         port=args.port,
+        workers=args.workers,
+        loop=loop,
+        http=http,
+        access_log=args.access_log,
         log_level="debug" if args.verbose else "info",
     )
 
@@ -0,0 +1,370 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import soundfile as sf
+from fastapi.testclient import TestClient
+
+from mlx_audio import server
+
+
+class FakeTTSWorker:
+    """Stands in for TTSWorker, writing a short tone instead of running a model."""
+
+    def __init__(self):
+        self.calls = 0
+        self.replies = []
+
+    def generate(self, **job):
+        self.calls += 1
+        if self.replies:
+            reply = self.replies.pop(0)
+            if callable(reply):
+                reply = reply()
+            if reply is not None:
+                return reply
+        audio = np.linspace(-0.5, 0.5, 2400, dtype=np.float32)
+        sf.write(job["output_path"], audio, 24000, format="WAV", subtype="PCM_16")
+        return {"num_frames": audio.shape[0]}
+
+    def stop(self):
+        pass
+
+
+class ServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.worker = FakeTTSWorker()
+        self.state = server.ServerState(
+            tts_worker=self.worker,
+            tts_executor=ThreadPoolExecutor(max_workers=1),
+            audio_player=None,
+            output_folder=self.output_dir.name,
+        )
+        server._state = self.state
+
+    def tearDown(self):
+        server._state = None
+        self.state.tts_executor.shutdown()
+        self.output_dir.cleanup()
+
+
+class TestBufferPool(unittest.TestCase):
+    def test_acquire_rounds_up_and_reuses(self):
+        """Test that released buffers are handed out again for the same bucket."""
+        pool = server.BufferPool(np.int16, max_size=1024, max_per_bucket=1)
+
+        buf = pool.acquire(100)
+        self.assertEqual(buf.shape, (100,))
+        self.assertEqual(buf.dtype, np.int16)
+        self.assertEqual(buf.base.shape, (128,))
+        pool.release(buf)
+
+        # Any size in the same power-of-two bucket reuses the storage
+        again = pool.acquire(120)
+        self.assertIs(again.base, buf.base)
+        # The bucket is empty again, so a second buffer is new
+        other = pool.acquire(120)
+        self.assertIsNot(other.base, buf.base)
+
+        # Only max_per_bucket buffers are kept
+        pool.release(again)
+        pool.release(other)
+        self.assertIs(pool.acquire(128).base, buf.base)
+        self.assertIsNot(pool.acquire(128).base, other.base)
+
+    def test_unpooled_buffers(self):
+        """Test that oversized and foreign buffers are never pooled."""
+        pool = server.BufferPool(np.int16, max_size=1024)
+
+        big = pool.acquire(2000)
+        self.assertEqual(big.shape, (2000,))
+        pool.release(big)
+        self.assertEqual(pool._buckets, {})
+
+        pool.release(np.empty(64, dtype=np.float32))
+        pool.release(np.empty(100, dtype=np.int16))
+        self.assertEqual(pool._buckets, {})
+
+
+class TestAudioFiles(unittest.TestCase):
+    def test_serves_wav_and_json_404(self):
+        """Test that /audio keeps the JSON errors and WAV type of the old handler."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            sf.write(
+                os.path.join(output_dir, "tts_test.wav"),
+                np.zeros(2400, dtype=np.float32),
+                24000,
+            )
+            client = TestClient(server.AudioFiles(directory=output_dir))
+
+            response = client.get("/tts_test.wav")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["content-type"], "audio/wav")
+
+            response = client.get("/tts_test.wav", headers={"Range": "bytes=0-99"})
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(len(response.content), 100)
+
+            response = client.get("/missing.wav")
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.json(), {"error": "File not found"})
+
+
+class TestFloatToPCM16(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.audio = np.concatenate(
+            [
+                rng.uniform(-1.0, 1.0, 100_000).astype(np.float32),
+                # Halfway cases, which round to even
+                np.arange(-8, 8, dtype=np.float32) / np.float32(32767.0) + 0.5 / 32767,
+                np.array([1.5 / 32767, 1.0, -1.0, 1.5, -1.5, 0.0], dtype=np.float32),
+            ]
+        ).astype(np.float32)
+
+    def test_clips(self):
+        """Test that float_to_pcm16 rounds and clips out of range samples."""
+        out = np.empty(self.audio.shape[0], dtype=np.int16)
+        server.float_to_pcm16(self.audio, out)
+        np.testing.assert_array_equal(
+            out[-6:], np.array([2, 32767, -32767, 32767, -32768, 0], dtype=np.int16)
+        )
+
+    @unittest.skipIf(server.numba is None, "numba is not installed")
+    def test_numba_matches_numpy(self):
+        """Test that the numba kernel agrees with the NumPy version."""
+        expected = np.empty(self.audio.shape[0], dtype=np.int16)
+        server._float_to_pcm16_numpy(self.audio, expected)
+        out = np.empty(self.audio.shape[0], dtype=np.int16)
+        server.float_to_pcm16(self.audio, out)
+        np.testing.assert_array_equal(out, expected)
+
+
+class TestTTSWorker(unittest.TestCase):
+    def test_generate_restarts_dead_process(self):
+        """Test that generate() starts a new process if the old one died."""
+        worker = server.TTSWorker(server.DEFAULT_MODEL)
+        worker.process = MagicMock()
+        worker.requests = MagicMock()
+        worker.responses = MagicMock()
+        worker.responses.get.return_value = {"num_frames": 10}
+        job = {
+            "model": "mlx-community/Kokoro-82M-8bit",
+            "output_path": "out.wav",
+            "text": "Hello",
+            "voice": "af_heart",
+            "speed": 1.0,
+        }
+
+        with patch.object(server.TTSWorker, "start") as start:
+            worker.process.is_alive.return_value = True
+            self.assertEqual(worker.generate(**job), {"num_frames": 10})
+            start.assert_not_called()
+
+            worker.process.is_alive.return_value = False
+            self.assertEqual(worker.generate(**job), {"num_frames": 10})
+            start.assert_called_once()
+            # The new process loads the model the job asks for
+            self.assertEqual(worker.model_path, "mlx-community/Kokoro-82M-8bit")
+
+        self.assertEqual(worker.requests.put.call_count, 2)
+
+
+class TestLifespan(unittest.TestCase):
+    def test_restart_builds_new_state(self):
+        """Test that shutdown clears the state so the next startup starts over."""
+        workers = []
+
+        class StartedFakeTTSWorker(FakeTTSWorker):
+            def __init__(self, model_path):
+                super().__init__()
+                self.stopped = False
+                workers.append(self)
+
+            def start(self):
+                pass
+
+            def stop(self):
+                self.stopped = True
+
+        with tempfile.TemporaryDirectory() as output_dir, patch.object(
+            server, "TTSWorker", StartedFakeTTSWorker
+        ), patch.object(server, "OUTPUT_FOLDER", output_dir), patch.object(
+            server, "AudioPlayer", side_effect=RuntimeError("no audio device")
+        ):
+            for run in range(2):
+                with TestClient(server.app) as client:
+                    response = client.post("/tts", data={"text": f"Hello {run}"})
+                    self.assertEqual(response.status_code, 200)
+                    state = server._state
+                self.assertIsNone(server._state)
+                self.assertTrue(workers[-1].stopped)
+                with self.assertRaises(RuntimeError):
+                    state.tts_executor.submit(print)
+
+        self.assertEqual(len(workers), 2)
+        self.assertEqual([w.calls for w in workers], [1, 1])
+
+
+class FakeAudioPlayer:
+    """Records queued blocks; each sleep() plays one block from the queue."""
+
+    sample_rate = 24000
+    buffer_size = 2048
+
+    def __init__(self):
+        self.audio_buffer = deque()
+        self.playing = False
+        self.played = []
+        self.max_queued = 0
+
+    def queue_audio(self, samples):
+        self.audio_buffer.append(np.array(samples))
+        self.max_queued = max(self.max_queued, len(self.audio_buffer))
+        self.playing = True
+
+    def play_one(self, seconds):
+        self.played.append(self.audio_buffer.popleft())
+
+
+class TestQueueAudioFile(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.output_dir.name, "stereo.wav")
+        rng = np.random.default_rng(0)
+        self.audio = rng.uniform(-0.5, 0.5, (50_000, 2)).astype(np.float32)
+        sf.write(self.file_path, self.audio, 24000, subtype="FLOAT")
+
+    def tearDown(self):
+        self.output_dir.cleanup()
+
+    def test_bounded_queue(self):
+        """Test that reading waits for playback instead of queueing the file."""
+        player = FakeAudioPlayer()
+        with patch.object(server.time, "sleep", side_effect=player.play_one):
+            server._queue_audio_file(sf.SoundFile(self.file_path), player)
+
+        self.assertLessEqual(player.max_queued, server.MAX_QUEUED_BLOCKS)
+        mono = np.concatenate(player.played + list(player.audio_buffer))
+        np.testing.assert_allclose(mono, self.audio.mean(axis=1), atol=1e-6)
+
+    def test_stops_with_player(self):
+        """Test that reading stops once the player has been stopped."""
+        player = FakeAudioPlayer()
+
+        def stop_player(seconds):
+            player.audio_buffer.clear()
+            player.playing = False
+
+        with patch.object(server.time, "sleep", side_effect=stop_player):
+            server._queue_audio_file(sf.SoundFile(self.file_path), player)
+
+        self.assertEqual(player.max_queued, server.MAX_QUEUED_BLOCKS)
+        self.assertEqual(len(player.audio_buffer), 0)
+
+
+class TestTTSEndpoint(ServerTestCase):
+    def test_cache_miss_then_hit(self):
+        """Test that a repeated request is served from the existing file."""
+        client = TestClient(server.app)
+
+        response = client.post("/tts", data={"text": "Hello"})
+        self.assertEqual(response.status_code, 200)
+        first = response.json()
+        self.assertFalse(first["cached"])
+        self.assertTrue(
+            os.path.exists(os.path.join(self.output_dir.name, first["filename"]))
+        )
+
+        response = client.post("/tts", data={"text": "Hello"})
+        self.assertEqual(response.status_code, 200)
+        second = response.json()
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["filename"], first["filename"])
+        self.assertEqual(self.worker.calls, 1)
+
+        # Different inputs map to a different file
+        response = client.post("/tts", data={"text": "Hello", "speed": "1.5"})
+        self.assertFalse(response.json()["cached"])
+        self.assertNotEqual(response.json()["filename"], first["filename"])
+        self.assertEqual(self.worker.calls, 2)
+
+        self.assertEqual(self.state.tts_locks, {})
+
+    def test_error_is_not_cached(self):
+        """Test that a failed generation leaves no file behind."""
+        self.worker.replies = [{"error": "boom"}]
+        client = TestClient(server.app)
+
+        response = client.post("/tts", data={"text": "Hello"})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {"error": "boom"})
+        self.assertEqual(os.listdir(self.output_dir.name), [])
+
+        response = client.post("/tts", data={"text": "Hello"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["cached"])
+        self.assertEqual(self.worker.calls, 2)
+
+    def test_lock_kept_while_requests_wait(self):
+        """Test that the key lock outlives a failed holder while others wait."""
+        first_started = threading.Event()
+        release_first = threading.Event()
+        second_started = threading.Event()
+        release_second = threading.Event()
+
+        def fail_first():
+            first_started.set()
+            release_first.wait(5)
+            return {"error": "boom"}
+
+        def block_second():
+            second_started.set()
+            release_second.wait(5)
+            return None  # Fall through to writing the file
+
+        self.worker.replies = [fail_first, block_second]
+
+        async def request():
+            return await server.tts_endpoint(
+                text="Hello",
+                voice="af_heart",
+                speed=1.0,
+                model=server.DEFAULT_MODEL,
+                state=self.state,
+            )
+
+        async def run():
+            first = asyncio.create_task(request())
+            await asyncio.to_thread(first_started.wait, 5)
+            second = asyncio.create_task(request())
+            await asyncio.sleep(0)
+
+            release_first.set()
+            self.assertEqual((await first).status_code, 500)
+            await asyncio.to_thread(second_started.wait, 5)
+
+            # The second request now holds the lock, so a third one has to
+            # wait for it instead of generating the same file again
+            self.assertEqual(len(self.state.tts_locks), 1)
+            third = asyncio.create_task(request())
+            await asyncio.sleep(0)
+            release_second.set()
+
+            self.assertFalse((await second)["cached"])
+            self.assertTrue((await third)["cached"])
+
+        asyncio.run(run())
+        self.assertEqual(self.worker.calls, 2)
+        self.assertEqual(self.state.tts_locks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
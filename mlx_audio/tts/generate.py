@@ -1,9 +1,12 @@
 import argparse
+import contextlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import mlx.core as mx
+import numpy as np
 import soundfile as sf
 
 from .audio_player import AudioPlayer
@@ -88,41 +91,30 @@ def generate_audio(
             verbose=True,
         )
 
-        audio_list = []
-        file_name = f"{file_prefix}.{audio_format}"
-        for i, result in enumerate(results):
-            if play:
-                player.queue_audio(result.audio)
-            if join_audio:
-                audio_list.append(result.audio)
-
-            else:
-                file_name = f"{file_prefix}_{i:03d}.{audio_format}"
-                sf.write(file_name, result.audio, 24000)
-
-            if verbose:
-
-                print("==========")
-                print(f"Duration:              {result.audio_duration}")
-                print(
-                    f"Samples/sec:           {result.audio_samples['samples-per-sec']:.1f}"
-                )
-                print(
-                    f"Prompt:                {result.token_count} tokens, {result.prompt['tokens-per-sec']:.1f} tokens-per-sec"
-                )
-                print(
-                    f"Audio:                 {result.audio_samples['samples']} samples, {result.audio_samples['samples-per-sec']:.1f} samples-per-sec"
-                )
-                print(f"Real-time factor:      {result.real_time_factor:.2f}x")
-                print(f"Processing time:       {result.processing_time_seconds:.2f}s")
-                print(f"Peak memory usage:     {result.peak_memory_usage:.2f}GB")
-                print(f"✅ Audio successfully generated and saving as: {file_name}")
+        # When joining, stream each segment straight into a single file
+        # instead of holding the whole waveform in memory
+        joined_file = (
+            sf.SoundFile(
+                f"{file_prefix}.{audio_format}", "w", samplerate=24000, channels=1
+            )
+            if join_audio
+            else None
+        )
+        output = contextlib.nullcontext() if joined_file is None else joined_file
+        write, on_segment = _make_handlers(
+            joined_file, player, file_prefix, audio_format, verbose
+        )
+        try:
+            with output:
+                num_segments, _ = write_segments(results, write, on_segment)
+        except BaseException:
+            # Don't leave a truncated joined file behind
+            if joined_file is not None and os.path.exists(joined_file.name):
+                os.remove(joined_file.name)
+            raise
 
-        if join_audio:
-            if verbose:
-                print(f"Joining {len(audio_list)} audio files")
-            audio = mx.concatenate(audio_list, axis=0)
-            sf.write(f"{file_prefix}.{audio_format}", audio, 24000)
+        if join_audio and verbose:
+            print(f"Joined {num_segments} audio segments into {joined_file.name}")
 
         if play:
             player.wait_for_drain()
@@ -140,6 +132,109 @@ def generate_audio(
         traceback.print_exc()
 
 
+def _print_stats(result, file_name: str):
+    """Print the generation stats for one segment in a single write."""
+    print(
+        "\n".join(
+            [
+                "==========",
+                f"Duration:              {result.audio_duration}",
+                f"Samples/sec:           {result.audio_samples['samples-per-sec']:.1f}",
+                f"Prompt:                {result.token_count} tokens, {result.prompt['tokens-per-sec']:.1f} tokens-per-sec",
+                f"Audio:                 {result.audio_samples['samples']} samples, {result.audio_samples['samples-per-sec']:.1f} samples-per-sec",
+                f"Real-time factor:      {result.real_time_factor:.2f}x",
+                f"Processing time:       {result.processing_time_seconds:.2f}s",
+                f"Peak memory usage:     {result.peak_memory_usage:.2f}GB",
+                f"✅ Audio successfully generated and saving as: {file_name}",
+            ]
+        )
+    )
+
+
+def write_segments(results, write, on_segment=None, dtype=None):
+    """
+    Consume generation results, passing each segment's audio to write(i, audio)
+    on a separate thread, so a segment is written while the next one is being
+    generated. on_segment(i, result, audio), if given, runs on the calling
+    thread as each segment arrives. Returns (segments, frames) written.
+
+    Every write has finished when this returns, so the caller can close the
+    file it writes to afterwards, even if generation raised.
+    """
+    num_segments = 0
+    num_frames = 0
+    pending = None
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for i, result in enumerate(results):
+            # Converting to NumPy evaluates the segment on this thread
+            audio = np.ascontiguousarray(result.audio, dtype=dtype)
+            if on_segment is not None:
+                on_segment(i, result, audio)
+            if pending is not None:
+                pending.result()
+            pending = writer.submit(write, i, audio)
+            num_segments += 1
+            num_frames += audio.shape[0]
+
+        if pending is not None:
+            pending.result()
+    return num_segments, num_frames
+
+
+def _make_handlers(
+    joined_file: Optional[sf.SoundFile],
+    player: Optional[AudioPlayer],
+    file_prefix: str,
+    audio_format: str,
+    verbose: bool,
+):
+    """
+    Build generate_audio's per-segment handlers for write_segments once from
+    the output options, so the segment loop does no option checks of its own.
+
+    Returns (write, on_segment). write(i, audio) saves a segment, to the joined
+    file if there is one or to its own numbered file. on_segment(i, result,
+    audio) queues the audio on the player and prints stats if verbose, and is
+    None when there is nothing to do.
+    """
+    if joined_file is not None:
+
+        def write(i, audio):
+            joined_file.write(audio)
+
+        def file_name(i):
+            return joined_file.name
+
+    else:
+
+        def file_name(i):
+            return f"{file_prefix}_{i:03d}.{audio_format}"
+
+        def write(i, audio):
+            sf.write(file_name(i), audio, 24000)
+
+    if player is not None and verbose:
+
+        def on_segment(i, result, audio):
+            player.queue_audio(audio)
+            _print_stats(result, file_name(i))
+
+    elif player is not None:
+
+        def on_segment(i, result, audio):
+            player.queue_audio(audio)
+
+    elif verbose:
+
+        def on_segment(i, result, audio):
+            _print_stats(result, file_name(i))
+
+    else:
+        on_segment = None
+
+    return write, on_segment
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Generate audio from text using TTS.")
     parser.add_argument(
@@ -73,6 +73,9 @@ class Model(nn.Module):
         super().__init__()
         self.repo_id = repo_id
         self.config = config
+        # Pipelines are cached per language code so that G2P setup and loaded
+        # voice packs are reused across generate() calls
+        self._pipelines = {}
         self.vocab = config["vocab"]
         self.bert = CustomAlbert(
             AlbertModelArgs(vocab_size=config["n_token"], **config["plbert"])
@@ -241,6 +244,16 @@ class Model(nn.Module):
                 sanitized_weights[key] = self.decoder.sanitize(key, state_dict)
         return sanitized_weights
 
+    def get_pipeline(self, lang_code: str) -> KokoroPipeline:
+        """Return the cached KokoroPipeline for lang_code, creating it if needed."""
+        if lang_code not in self._pipelines:
+            self._pipelines[lang_code] = KokoroPipeline(
+                model=self,
+                repo_id=self.REPO_ID if self.repo_id is None else self.repo_id,
+                lang_code=lang_code,
+            )
+        return self._pipelines[lang_code]
+
     def generate(
         self,
         text: str,
@@ -251,11 +264,7 @@ class Model(nn.Module):
         verbose: bool = False,
         **kwargs,
     ):
-        pipeline = KokoroPipeline(
-            model=self,
-            repo_id=self.REPO_ID if self.repo_id is None else self.repo_id,
-            lang_code=lang_code,
-        )
+        pipeline = self.get_pipeline(lang_code)
 
         # Track overall generation time
         start_time = time.time()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import soundfile as sf
+
+from mlx_audio.tts.generate import _make_handlers, write_segments
+
+
+def make_results(n, num_samples=240):
+    """Fake generation results with the fields _print_stats reads."""
+    return [
+        SimpleNamespace(
+            audio=np.full(num_samples, 0.1 * (i + 1), dtype=np.float32),
+            audio_duration="00:00:00.010",
+            audio_samples={"samples": num_samples, "samples-per-sec": 2400.0},
+            token_count=5,
+            prompt={"tokens-per-sec": 50.0},
+            real_time_factor=0.5,
+            processing_time_seconds=0.1,
+            peak_memory_usage=0.5,
+        )
+        for i in range(n)
+    ]
+
+
+class TestWriteSegments(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.file_prefix = os.path.join(self.output_dir.name, "audio")
+
+    def tearDown(self):
+        self.output_dir.cleanup()
+
+    def emit_all(self, results, joined_file=None, player=None, verbose=False):
+        write, on_segment = _make_handlers(
+            joined_file, player, self.file_prefix, "wav", verbose
+        )
+        return write_segments(iter(results), write, on_segment)
+
+    def test_per_segment_files(self):
+        """Test that each segment is written to its own numbered file."""
+        results = make_results(3)
+        self.assertEqual(self.emit_all(results), (3, 720))
+
+        self.assertEqual(
+            sorted(os.listdir(self.output_dir.name)),
+            ["audio_000.wav", "audio_001.wav", "audio_002.wav"],
+        )
+        audio, sample_rate = sf.read(f"{self.file_prefix}_001.wav", dtype="float32")
+        self.assertEqual(sample_rate, 24000)
+        np.testing.assert_allclose(audio, results[1].audio, atol=1e-4)
+
+    def test_joined_file(self):
+        """Test that segments are appended to the joined file in order."""
+        results = make_results(3)
+        joined_path = f"{self.file_prefix}.wav"
+        with sf.SoundFile(joined_path, "w", samplerate=24000, channels=1) as f:
+            self.emit_all(results, joined_file=f)
+
+        self.assertEqual(os.listdir(self.output_dir.name), ["audio.wav"])
+        audio, _ = sf.read(joined_path, dtype="float32")
+        np.testing.assert_allclose(
+            audio, np.concatenate([r.audio for r in results]), atol=1e-4
+        )
+
+    def test_player_queueing(self):
+        """Test that every segment is queued on the player as well as saved."""
+        results = make_results(2)
+        player = MagicMock()
+        self.emit_all(results, player=player)
+
+        self.assertEqual(player.queue_audio.call_count, 2)
+        for call, result in zip(player.queue_audio.call_args_list, results):
+            np.testing.assert_array_equal(call.args[0], result.audio)
+        self.assertEqual(len(os.listdir(self.output_dir.name)), 2)
+
+    def test_verbose_prints_once_per_segment(self):
+        """Test that verbose stats are printed with a single call per segment."""
+        results = make_results(2)
+        with patch("builtins.print") as mock_print:
+            self.emit_all(results, verbose=True)
+
+        self.assertEqual(mock_print.call_count, 2)
+        output = mock_print.call_args_list[1].args[0]
+        self.assertIn("Real-time factor:      0.50x", output)
+        self.assertIn(f"{self.file_prefix}_001.wav", output)
+
+        with patch("builtins.print") as mock_print:
+            self.emit_all(results, verbose=False)
+        mock_print.assert_not_called()
+
+    def test_waits_for_writes_on_error(self):
+        """Test that pending writes finish before a generation error propagates."""
+        written = []
+
+        def results():
+            yield from make_results(2)
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            write_segments(results(), lambda i, audio: written.append(i))
+        self.assertEqual(written, [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
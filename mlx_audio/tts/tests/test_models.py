@@ -152,6 +152,30 @@ class TestKokoroModel(unittest.TestCase):
         self.assertIs(output.audio, audio)
         self.assertIs(output.pred_dur, pred_dur)
 
+    @patch("mlx_audio.tts.models.kokoro.kokoro.KokoroPipeline")
+    def test_get_pipeline(self, mock_pipeline):
+        """Test that pipelines are cached per language code."""
+        # Import inside the test method
+        from mlx_audio.tts.models.kokoro.kokoro import Model
+
+        # Mock __init__ to return None
+        with patch.object(Model, "__init__", return_value=None):
+            model = Model({})
+        model.repo_id = None
+        model._pipelines = {}
+
+        # Repeated calls with the same language reuse the pipeline
+        pipeline = model.get_pipeline("a")
+        self.assertIs(model.get_pipeline("a"), pipeline)
+        self.assertEqual(mock_pipeline.call_count, 1)
+        mock_pipeline.assert_called_with(
+            model=model, repo_id=Model.REPO_ID, lang_code="a"
+        )
+
+        # A new language creates a new pipeline
+        model.get_pipeline("b")
+        self.assertEqual(mock_pipeline.call_count, 2)
+
 
 @patch("importlib.resources.open_text", patched_open_text)
 class TestKokoroPipeline(unittest.TestCase):
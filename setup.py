@@ -43,6 +43,11 @@ setup(
     python_requires=">=3.8",
     extras_require={
         "py38": ["importlib_resources"],
+        "server": [
+            "numba>=0.59.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "httptools>=0.5.0",
+        ],
     },
     entry_points={
         "console_scripts": [